@@ -3,6 +3,7 @@
 Setup script for Video Terminal Tool
 """
 
+import shutil
 import subprocess
 import sys
 import os
@@ -17,15 +18,10 @@ def check_python_version():
 
 def check_ffmpeg():
     """Check if FFmpeg is installed"""
-    try:
-        result = subprocess.run(['ffmpeg', '-version'], 
-                              capture_output=True, text=True)
-        if result.returncode == 0:
-            print("✅ FFmpeg is installed")
-            return True
-    except FileNotFoundError:
-        pass
-    
+    if shutil.which('ffmpeg'):
+        print("✅ FFmpeg is installed")
+        return True
+
     print("❌ FFmpeg not found!")
     print("📥 Please install FFmpeg:")
     print("   Windows: Download from https://ffmpeg.org/download.html")
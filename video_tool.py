@@ -5,9 +5,15 @@ A cool command-line interface for video processing
 Features: Resize videos and split videos by duration
 """
 
+import asyncio
+import concurrent.futures
+import functools
+import json
+import math
 import os
+import shutil
+import subprocess
 import sys
-import ffmpeg
 from pathlib import Path
 import time
 
@@ -17,7 +23,7 @@ try:
     from rich.text import Text
     from rich.table import Table
     from rich.prompt import Prompt, IntPrompt
-    from rich.progress import Progress, SpinnerColumn, TextColumn
+    from rich.progress import Progress, TextColumn, BarColumn, TimeRemainingColumn
     from rich.align import Align
     from rich.box import ROUNDED, DOUBLE, HEAVY
 except ImportError:
@@ -28,52 +34,83 @@ except ImportError:
 # Create console instance
 console = Console()
 
+# Video extensions as a tuple so str.endswith can check them all in one C call
+VIDEO_EXTS = ('.mp4', '.avi', '.mov', '.wmv', '.mkv', '.flv', '.m4v')
+
+# Most directories are dominated by one container, so remember the last
+# extension that matched and try it first
+_LAST_EXT = VIDEO_EXTS[0]
+
+# One scan serves a whole session of back-to-back operations; the directory
+# mtime invalidates the cache as soon as any file is added or removed
+_scan_cache = {'mtime': None, 'files': None, 'sizes': None}
+
+# The banner and menu never change, so build their renderables once at import
+# instead of reallocating Panels/Tables on every menu draw
+BANNER_PANEL = Panel(
+    Align.center(Text.assemble(
+        Text("🎬 VIDEO TERMINAL TOOL 🎬", style="bold magenta"), "\n",
+        Text("Resize & Split Videos Like a Pro!", style="cyan")
+    )),
+    box=DOUBLE,
+    style="bright_magenta",
+    padding=(1, 2),
+    title="[bold bright_white]Welcome[/bold bright_white]",
+    title_align="center"
+)
+
+MENU_TABLE = Table(show_header=False, box=ROUNDED, style="cyan")
+MENU_TABLE.add_column("Option", style="bold bright_blue", width=30)
+MENU_TABLE.add_row("1.Resize Video")
+MENU_TABLE.add_row("2.Split Video")
+MENU_TABLE.add_row("3.Crop Video (Social Media)")
+MENU_TABLE.add_row("4.List Videos")
+MENU_TABLE.add_row("5.Batch Resize (Parallel)")
+MENU_TABLE.add_row("6.Resize + Crop (One Pass)")
+MENU_TABLE.add_row("7.Exit")
+
 def print_banner():
     """Print a cool banner using rich"""
-    title = Text("🎬 VIDEO TERMINAL TOOL 🎬", style="bold magenta")
-    subtitle = Text("Resize & Split Videos Like a Pro!", style="cyan")
-    
-    # Create the main panel
-    banner_content = Align.center(Text.assemble(title, "\n", subtitle))
-    
-    banner_panel = Panel(
-        banner_content,
-        box=DOUBLE,
-        style="bright_magenta",
-        padding=(1, 2),
-        title="[bold bright_white]Welcome[/bold bright_white]",
-        title_align="center"
-    )
-    
     console.print()
-    console.print(banner_panel, justify="center")
+    console.print(BANNER_PANEL, justify="center")
     console.print()
 
 def print_menu():
     """Print the main menu using rich"""
     # Print title above the menu
     console.print("\n[bold bright_cyan]SELECT AN OPTION[/bold bright_cyan]", justify="center")
-    
-    # Create a table for the menu without panel box
-    menu_table = Table(show_header=False, box=ROUNDED, style="cyan")
-    menu_table.add_column("Option", style="bold bright_blue", width=30)
-    
-    menu_table.add_row("1.Resize Video")
-    menu_table.add_row("2.Split Video")
-    menu_table.add_row("3.Crop Video (Social Media)")
-    menu_table.add_row("4.List Videos")
-    menu_table.add_row("5.Exit")
-    
-    console.print(menu_table, justify="center")
+    console.print(MENU_TABLE, justify="center")
 
 def list_video_files():
     """List all video files in the current directory"""
-    video_extensions = ['.mp4', '.avi', '.mov', '.wmv', '.mkv', '.flv', '.m4v']
-    video_files = []
-    
-    for file in os.listdir('.'):
-        if any(file.lower().endswith(ext) for ext in video_extensions):
-            video_files.append(file)
+    global _LAST_EXT
+    dir_mtime = os.stat('.').st_mtime_ns
+
+    if dir_mtime == _scan_cache['mtime']:
+        # Unchanged directory — reuse the previous scan instead of re-walking
+        video_files = _scan_cache['files']
+        file_sizes = _scan_cache['sizes']
+    else:
+        video_files = []
+        file_sizes = []
+
+        # scandir reuses the cached dirent type, so filtering needs no extra stat per
+        # entry, and the size stat below is the only syscall per matched file
+        with os.scandir('.') as it:
+            for entry in it:
+                if not entry.is_file(follow_symlinks=False):
+                    continue
+                name = entry.name.lower()
+                if name.endswith(_LAST_EXT):
+                    pass
+                elif name.endswith(VIDEO_EXTS):
+                    _LAST_EXT = os.path.splitext(name)[1]
+                else:
+                    continue
+                video_files.append(entry.name)
+                file_sizes.append(entry.stat(follow_symlinks=False).st_size)
+
+        _scan_cache.update(mtime=dir_mtime, files=video_files, sizes=file_sizes)
     
     if video_files:
         console.print("\n📁 Available Video Files:", style="bold green")
@@ -84,9 +121,8 @@ def list_video_files():
         files_table.add_column("File Name", style="bright_white")
         files_table.add_column("Size (MB)", style="yellow", justify="right")
         
-        for i, file in enumerate(video_files, 1):
-            file_size = os.path.getsize(file) / (1024 * 1024)  # Size in MB
-            files_table.add_row(str(i), file, f"{file_size:.1f}")
+        for i, (file, size) in enumerate(zip(video_files, file_sizes), 1):
+            files_table.add_row(str(i), file, f"{size / (1024 * 1024):.1f}")
         
         files_panel = Panel(
             files_table,
@@ -100,27 +136,232 @@ def list_video_files():
         console.print("⚠️  No video files found in current directory!", style="bold yellow")
         return []
 
+def select_video_file(video_files):
+    """Prompt for a 1-based file index, validating with a plain range check
+    instead of handing Rich an N-element choices list to match against"""
+    while True:
+        choice = IntPrompt.ask("\n[cyan]Select video file[/cyan]")
+        if 1 <= choice <= len(video_files):
+            return choice - 1
+        console.print(f"❌ Please enter a number between 1 and {len(video_files)}!", style="bold red")
+
+def _sidecar_path(file_path):
+    """Path of the hidden sidecar JSON that stores probe metadata for a video"""
+    directory, name = os.path.split(file_path)
+    return os.path.join(directory, f".{name}.probe.json")
+
+def _probe_raw(file_path):
+    """Run ffprobe on a file and extract the fields we actually use.
+
+    Only the first video stream and the fields we read are requested, and
+    -probesize/-analyzeduration bound how much of the file the demuxer scans,
+    so for MP4/MOV this reads just the header instead of decoding frames."""
+    result = subprocess.run(
+        ['ffprobe', '-v', 'error',
+         '-select_streams', 'v:0',
+         '-show_entries', 'stream=codec_name,width,height:format=duration',
+         '-of', 'json',
+         '-probesize', '512K',
+         '-analyzeduration', '0',
+         '-fflags', '+fastseek',
+         file_path],
+        capture_output=True, text=True
+    )
+    if result.returncode != 0:
+        raise RuntimeError(result.stderr.strip() or "ffprobe failed")
+
+    probe = json.loads(result.stdout)
+    # -select_streams v:0 guarantees at most one stream, no need to scan
+    video_stream = probe['streams'][0]
+
+    return {
+        'width': video_stream['width'],
+        'height': video_stream['height'],
+        'duration': float(probe['format']['duration']),
+        'codec': video_stream.get('codec_name', '')
+    }
+
+@functools.lru_cache(maxsize=256)
+def _probe_cached(file_path, mtime, size):
+    """Cached probe keyed on (path, mtime, size) so unchanged files never reprobe.
+    Also persists a sidecar JSON next to the video so the cache survives restarts."""
+    sidecar = _sidecar_path(file_path)
+    try:
+        with open(sidecar) as f:
+            cached = json.load(f)
+        if cached.get('mtime') == mtime:
+            return cached['info']
+    except (OSError, ValueError, KeyError):
+        pass  # Missing or stale sidecar, fall through to a real probe
+
+    info = _probe_raw(file_path)
+    try:
+        with open(sidecar, 'w') as f:
+            json.dump({'mtime': mtime, 'info': info}, f)
+    except OSError:
+        pass  # Read-only directory, cache stays in-memory only
+    return info
+
 def get_video_info(file_path):
-    """Get video information using ffprobe"""
+    """Get video information using ffprobe (cached so repeated calls skip the probe)"""
     try:
-        probe = ffmpeg.probe(file_path)
-        video_stream = next(s for s in probe['streams'] if s['codec_type'] == 'video')
-        
-        width = video_stream['width']
-        height = video_stream['height']
-        duration = float(probe['format']['duration'])
-        
+        stat = os.stat(file_path)
+        info = _probe_cached(file_path, stat.st_mtime, stat.st_size)
+
+        width = info['width']
+        height = info['height']
+
         return {
             'width': width,
             'height': height,
-            'duration': duration,
+            'duration': info['duration'],
             'resolution': f"{width}x{height}"
         }
     except Exception as e:
         console.print(f"❌ Error getting video info: {str(e)}", style="bold red")
         return None
 
-def resize_video():
+# Hand-written argv templates for the fixed ffmpeg recipes. Substituting
+# placeholders into a cached tuple replaces ffmpeg-python's per-call node
+# graph walk and drops its import from the hot path entirely.
+FFMPEG_IN = ('ffmpeg', '-y', '-fflags', '+fastseek', '-i', '{src}')
+# -noautorotate only makes sense when stream-copying: re-encode paths must
+# keep ffmpeg's default rotation handling so phone footage stays upright
+REMUX_ARGV = ('ffmpeg', '-y', '-noautorotate', '-fflags', '+fastseek', '-i', '{src}', '-c', 'copy')
+SCALE_ARGV = FFMPEG_IN + ('-vf', 'scale={res}')
+CROP_ARGV = FFMPEG_IN + ('-vf', 'crop={w}:{h}:(iw-{w})/2:(ih-{h})/2')
+SCALE_CROP_ARGV = FFMPEG_IN + ('-vf', 'scale={res},crop={w}:{h}:(iw-{w})/2:(ih-{h})/2')
+SEGMENT_REENCODE_ARGV = ('ffmpeg', '-y', '-fflags', '+fastseek',
+                         '-ss', '{start}', '-to', '{stop}', '-i', '{src}')
+
+def fill_argv(template, **values):
+    """Substitute {placeholders} in a cached argv template"""
+    return [arg.format_map(values) for arg in template]
+
+def scale_expr(resolution):
+    """Turn a WxH resolution string into the W:H form the scale filter expects"""
+    return resolution.replace('x', ':')
+
+def _encoder_works(encoder):
+    """Verify an encoder with a one-frame null encode.
+
+    Being listed in `ffmpeg -encoders` only means the encoder was compiled
+    in; NVENC/QuickSync still fail at runtime without the GPU or driver."""
+    result = subprocess.run(
+        ['ffmpeg', '-hide_banner', '-f', 'lavfi', '-i', 'nullsrc',
+         '-frames:v', '1', '-c:v', encoder, '-f', 'null', '-'],
+        capture_output=True
+    )
+    return result.returncode == 0
+
+@functools.cache
+def pick_video_encoder():
+    """Pick the best available H.264 encoder, probing `ffmpeg -encoders` once.
+
+    Hardware encoders (NVENC/QuickSync/VideoToolbox) move the encode off the
+    CPU entirely; otherwise fall back to libx264."""
+    try:
+        result = subprocess.run(['ffmpeg', '-hide_banner', '-encoders'],
+                                capture_output=True, text=True)
+        encoders = result.stdout
+    except OSError:
+        encoders = ''
+
+    for encoder in ('h264_nvenc', 'h264_qsv', 'h264_videotoolbox'):
+        if encoder in encoders and _encoder_works(encoder):
+            return encoder
+    return 'libx264'
+
+def encode_args():
+    """Argv fragment for the chosen video encoder (audio is always stream-copied)"""
+    encoder = pick_video_encoder()
+    args = ['-c:v', encoder, '-c:a', 'copy']
+    if encoder == 'libx264':
+        # threads 0 lets libx264 saturate every core instead of one pipeline
+        args += ['-threads', '0', '-preset', 'veryfast']
+    elif encoder == 'h264_nvenc':
+        args += ['-preset', 'p4']
+    return args
+
+async def run_with_progress(argv, duration, description):
+    """Run an ffmpeg argv as an asyncio subprocess, streaming its
+    -progress output into a real progress bar. stderr is drained
+    concurrently instead of buffered behind a blocking wait, and
+    cancelling (Ctrl+C) terminates the child instead of orphaning it."""
+    total = int(duration * 1_000_000)  # out_time_ms is in microseconds
+    argv = argv[:1] + ['-progress', 'pipe:1', '-nostats'] + argv[1:]
+
+    process = await asyncio.create_subprocess_exec(
+        *argv,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE,
+    )
+    stderr_task = asyncio.ensure_future(process.stderr.read())
+
+    try:
+        with Progress(
+            TextColumn("[progress.description]{task.description}"),
+            BarColumn(),
+            TimeRemainingColumn(),
+            console=console,
+        ) as progress:
+            task = progress.add_task(description, total=total)
+            async for line in process.stdout:
+                line = line.decode(errors='replace').strip()
+                if line.startswith('out_time_ms='):
+                    try:
+                        progress.update(task, completed=min(int(line.split('=', 1)[1]), total))
+                    except ValueError:
+                        pass  # out_time_ms=N/A before the first frame
+                elif line == 'progress=end':
+                    progress.update(task, completed=total)
+
+        stderr = await stderr_task
+        await process.wait()
+    except (asyncio.CancelledError, KeyboardInterrupt):
+        process.terminate()
+        # Reap the child so its transport is closed before the loop shuts down
+        await process.wait()
+        raise
+
+    if process.returncode != 0:
+        raise RuntimeError(stderr.decode(errors='replace').strip() or "ffmpeg failed")
+
+async def split_video_stream_copy(input_file, output_prefix, segment_duration, total_duration, ext):
+    """Split a video with ffmpeg's segment muxer — one process, no re-encode.
+
+    The muxer demuxes the source once and stream-copies keyframe-aligned
+    chunks, so boundaries can drift by up to a GOP from the exact times."""
+    argv = ['ffmpeg', '-y', '-i', input_file,
+            '-c', 'copy', '-map', '0',
+            '-f', 'segment',
+            '-segment_time', str(segment_duration),
+            '-reset_timestamps', '1',
+            f'{output_prefix}_%03d{ext}']
+    await run_with_progress(argv, total_duration, "Splitting video...")
+
+async def split_video_reencode(input_file, output_prefix, segment_duration, total_duration, ext):
+    """Split with exact boundaries by re-encoding each segment (much slower)"""
+    total_segments = math.ceil(total_duration / segment_duration)
+    segment = 0
+    start = 0.0
+    while start < total_duration:
+        output_file = f"{output_prefix}_{segment:03d}{ext}"
+        # Input-side seeking jumps the demuxer to the keyframe before `start`
+        # instead of decoding linearly from the beginning of the file
+        argv = (
+            fill_argv(SEGMENT_REENCODE_ARGV, src=input_file,
+                      start=start, stop=start + segment_duration)
+            + encode_args() + [output_file]
+        )
+        await run_with_progress(
+            argv, min(segment_duration, total_duration - start),
+            f"Encoding segment {segment + 1}/{total_segments}..."
+        )
+        segment += 1
+        start += segment_duration
+
+async def resize_video():
     """Resize video functionality"""
     # Create header panel
     header_panel = Panel(
@@ -137,7 +378,7 @@ def resize_video():
     
     # Select video file
     try:
-        choice = IntPrompt.ask(f"\n[cyan]Select video file[/cyan]", choices=[str(i) for i in range(1, len(video_files)+1)]) - 1
+        choice = select_video_file(video_files)
         
         input_file = video_files[choice]
         console.print(f"✅ Selected: [green]{input_file}[/green]")
@@ -196,39 +437,32 @@ def resize_video():
         
         # Resize video using ffmpeg with progress
         try:
-            with Progress(
-                SpinnerColumn(),
-                TextColumn("[progress.description]{task.description}"),
-                console=console,
-            ) as progress:
-                task = progress.add_task("Resizing video...", total=None)
-                
-                (
-                    ffmpeg
-                    .input(input_file)
-                    .filter('scale', target_resolution)
-                    .output(output_file, vcodec='libx264', acodec='copy')
-                    .overwrite_output()
-                    .run(capture_stdout=True, capture_stderr=True)
+            if info['resolution'] == target_resolution:
+                # Source already matches the target — pure remux, no decode/encode
+                argv = fill_argv(REMUX_ARGV, src=input_file) + [output_file]
+            else:
+                argv = (
+                    fill_argv(SCALE_ARGV, src=input_file, res=scale_expr(target_resolution))
+                    + encode_args() + [output_file]
                 )
-                
+
+            await run_with_progress(argv, info['duration'], "Resizing video...")
+
             console.print("✅ Video resized successfully!", style="bold green")
-            
-            # Show new file info
-            new_info = get_video_info(output_file)
-            if new_info:
-                new_size = os.path.getsize(output_file) / (1024 * 1024)
-                console.print(f"📊 New file: [green]{output_file}[/green] ([yellow]{new_size:.1f} MB[/yellow], [blue]{new_info['resolution']}[/blue])")
+
+            # Show new file info (we set the resolution ourselves, no need to reprobe)
+            new_size = os.path.getsize(output_file) / (1024 * 1024)
+            console.print(f"📊 New file: [green]{output_file}[/green] ([yellow]{new_size:.1f} MB[/yellow], [blue]{target_resolution}[/blue])")
                 
-        except ffmpeg.Error as e:
-            console.print(f"❌ Error resizing video: {e.stderr.decode() if e.stderr else str(e)}", style="bold red")
+        except RuntimeError as e:
+            console.print(f"❌ Error resizing video: {str(e)}", style="bold red")
         
     except ValueError:
         console.print("❌ Please enter a valid number!", style="bold red")
     except KeyboardInterrupt:
         console.print("\n⚠️  Operation cancelled by user", style="bold yellow")
 
-def split_video():
+async def split_video():
     """Split video functionality"""
     # Create header panel
     header_panel = Panel(
@@ -245,7 +479,7 @@ def split_video():
     
     try:
         # Select video file
-        choice = IntPrompt.ask(f"\n[cyan]Select video file[/cyan]", choices=[str(i) for i in range(1, len(video_files)+1)]) - 1
+        choice = select_video_file(video_files)
         
         input_file = video_files[choice]
         console.print(f"✅ Selected: [green]{input_file}[/green]")
@@ -294,28 +528,28 @@ def split_video():
         if not os.path.exists(segments_dir):
             os.makedirs(segments_dir)
         
-        name = os.path.splitext(input_file)[0]
+        name, ext = os.path.splitext(input_file)
         output_prefix = f"{segments_dir}/{name}_segment"
+
+        # Stream copy cuts on keyframes; re-encoding gives exact times but is much slower
+        exact = Prompt.ask(
+            "\n[cyan]Cut at exact times? (re-encodes, much slower)[/cyan]",
+            choices=['y', 'n'], default='n'
+        ) == 'y'
         
         # Calculate expected segments
-        expected_segments = int(info['duration'] / segment_duration) + (1 if info['duration'] % segment_duration > 0 else 0)
+        expected_segments = math.ceil(info['duration'] / segment_duration)
         
         console.print(f"\n🔄 Splitting video into [yellow]{expected_segments}[/yellow] segments of [blue]{segment_duration}[/blue] seconds each...")
         console.print(f"📁 Output directory: [green]{segments_dir}[/green]")
         
         # Split the video with progress
         try:
-            with Progress(
-                SpinnerColumn(),
-                TextColumn("[progress.description]{task.description}"),
-                console=console,
-            ) as progress:
-                task = progress.add_task("Splitting video...", total=None)
-                
-                # Use the split function from split_video.py
-                from split_video import split_video_ffmpeg_python
-                split_video_ffmpeg_python(input_file, output_prefix, segment_duration)
-            
+            if exact:
+                await split_video_reencode(input_file, output_prefix, segment_duration, info['duration'], ext)
+            else:
+                await split_video_stream_copy(input_file, output_prefix, segment_duration, info['duration'], ext)
+
             console.print("✅ Video split successfully!", style="bold green")
             
         except Exception as e:
@@ -326,7 +560,88 @@ def split_video():
     except KeyboardInterrupt:
         console.print("\n⚠️  Operation cancelled by user", style="bold yellow")
 
-def crop_video():
+def _batch_resize_worker(args):
+    """Resize one file in a worker process (module-level so it pickles)"""
+    input_file, target_resolution = args
+    name, ext = os.path.splitext(input_file)
+    output_file = f"{name}_resized_{target_resolution.replace('x', '_')}{ext}"
+
+    argv = (
+        fill_argv(SCALE_ARGV, src=input_file, res=scale_expr(target_resolution))
+        + encode_args() + [output_file]
+    )
+    result = subprocess.run(argv, capture_output=True, text=True)
+    if result.returncode != 0:
+        raise RuntimeError(result.stderr.strip() or "ffmpeg resize failed")
+    return output_file
+
+def batch_resize_video():
+    """Resize multiple videos in parallel using a worker pool"""
+    # Create header panel
+    header_panel = Panel(
+        "🗂️  BATCH RESIZE MODE (Parallel)",
+        style="bold magenta",
+        box=HEAVY,
+        title_align="center"
+    )
+    console.print(header_panel)
+
+    video_files = list_video_files()
+    if not video_files:
+        return
+
+    try:
+        # Select files
+        selection = Prompt.ask("\n[cyan]Select files (e.g. 1,3,5 or 'all')[/cyan]", default="all")
+
+        if selection.strip().lower() == 'all':
+            selected_files = video_files
+        else:
+            indices = [int(part) - 1 for part in selection.split(',')]
+            if any(i < 0 or i >= len(video_files) for i in indices):
+                console.print("❌ Invalid selection!", style="bold red")
+                return
+            selected_files = [video_files[i] for i in indices]
+
+        target_resolution = Prompt.ask("[cyan]Target resolution (e.g. 1280x720)[/cyan]", default="1280x720")
+
+        # libx264 is already multithreaded, so cap workers at half the cores
+        max_workers = max(1, (os.cpu_count() or 2) // 2)
+
+        console.print(f"\n🔄 Resizing [yellow]{len(selected_files)}[/yellow] videos to [blue]{target_resolution}[/blue] with [green]{max_workers}[/green] workers...")
+
+        # Run one ffmpeg pipeline per file across the worker pool
+        with Progress(
+            TextColumn("[progress.description]{task.description}"),
+            BarColumn(),
+            TimeRemainingColumn(),
+            console=console,
+        ) as progress:
+            task = progress.add_task("Batch resizing...", total=len(selected_files))
+
+            with concurrent.futures.ProcessPoolExecutor(max_workers=max_workers) as executor:
+                futures = [
+                    executor.submit(_batch_resize_worker, (file, target_resolution))
+                    for file in selected_files
+                ]
+                for future in futures:
+                    future.add_done_callback(lambda _: progress.advance(task))
+
+                for future in concurrent.futures.as_completed(futures):
+                    try:
+                        output_file = future.result()
+                        console.print(f"✅ [green]{output_file}[/green]")
+                    except Exception as e:
+                        console.print(f"❌ Error resizing video: {str(e)}", style="bold red")
+
+        console.print("✅ Batch resize finished!", style="bold green")
+
+    except ValueError:
+        console.print("❌ Please enter a valid number!", style="bold red")
+    except KeyboardInterrupt:
+        console.print("\n⚠️  Operation cancelled by user", style="bold yellow")
+
+async def crop_video():
     """Crop video functionality for social media platforms"""
     # Create header panel
     header_panel = Panel(
@@ -343,11 +658,8 @@ def crop_video():
     
     # Select video file
     try:
-        choice = int(Prompt.ask(f"\n[cyan]Select video file (1-{len(video_files)})[/cyan]")) - 1
-        if choice < 0 or choice >= len(video_files):
-            console.print("❌ Invalid selection!", style="bold red")
-            return
-        
+        choice = select_video_file(video_files)
+
         input_file = video_files[choice]
         console.print(f"✅ Selected: [green]{input_file}[/green]")
         
@@ -359,13 +671,14 @@ def crop_video():
         console.print(f"📊 Current Resolution: [blue]{info['resolution']}[/blue]")
         
         # Show crop options for different social media platforms
+        # (aspect ratio, platform label, filename slug) per menu key
         crop_options = {
-            '1': ('1080:1920', 'TikTok/Instagram Stories (9:16)'),
-            '2': ('1080:1080', 'Instagram Post (1:1)'),
-            '3': ('1200:630', 'Facebook Post (1.91:1)'),
-            '4': ('1080:608', 'YouTube Thumbnail (16:9)'),
-            '5': ('1080:1350', 'Instagram Feed (4:5)'),
-            '6': ('custom', 'Custom Crop')
+            '1': ('1080:1920', 'TikTok/Instagram Stories (9:16)', 'tiktok_stories_9x16'),
+            '2': ('1080:1080', 'Instagram Post (1:1)', 'instagram_post_1x1'),
+            '3': ('1200:630', 'Facebook Post (1.91:1)', 'facebook_post_1_91x1'),
+            '4': ('1080:608', 'YouTube Thumbnail (16:9)', 'youtube_thumbnail_16x9'),
+            '5': ('1080:1350', 'Instagram Feed (4:5)', 'instagram_feed_4x5'),
+            '6': ('custom', 'Custom Crop', 'custom')
         }
         
         # Create crop options table
@@ -374,7 +687,7 @@ def crop_video():
         crop_table.add_column("Platform", style="bright_white")
         crop_table.add_column("Aspect Ratio", style="yellow")
         
-        for key, (ratio, platform) in crop_options.items():
+        for key, (ratio, platform, _) in crop_options.items():
             crop_table.add_row(key, platform, ratio if ratio != 'custom' else 'Custom')
         
         crop_panel = Panel(
@@ -392,7 +705,7 @@ def crop_video():
             height = int(Prompt.ask("[cyan]Enter crop height[/cyan]"))
             platform_name = "Custom"
         elif crop_choice in crop_options:
-            ratio, platform_name = crop_options[crop_choice]
+            ratio, platform_name, _ = crop_options[crop_choice]
             width, height = ratio.split(':')
             width, height = int(width), int(height)
             
@@ -419,21 +732,7 @@ def crop_video():
         
         # Generate output filename with proper sanitization
         name, ext = os.path.splitext(input_file)
-        
-        # Create a clean platform name for filename
-        if crop_choice == '1':
-            clean_platform = "tiktok_stories_9x16"
-        elif crop_choice == '2':
-            clean_platform = "instagram_post_1x1"
-        elif crop_choice == '3':
-            clean_platform = "facebook_post_1_91x1"
-        elif crop_choice == '4':
-            clean_platform = "youtube_thumbnail_16x9"
-        elif crop_choice == '5':
-            clean_platform = "instagram_feed_4x5"
-        else:
-            clean_platform = "custom"
-        
+        clean_platform = crop_options[crop_choice][2]
         output_file = f"{name}_cropped_{clean_platform}{ext}"
         
         console.print(f"\n🔄 Cropping video for [yellow]{platform_name}[/yellow]...")
@@ -441,40 +740,95 @@ def crop_video():
         
         # Crop video using ffmpeg with progress
         try:
-            with Progress(
-                SpinnerColumn(),
-                TextColumn("[progress.description]{task.description}"),
-                console=console,
-            ) as progress:
-                task = progress.add_task("Cropping video...", total=None)
-                
-                # Use the correct FFmpeg crop filter format with audio copy
-                (
-                    ffmpeg
-                    .input(input_file)
-                    .filter('crop', int(width), int(height), f'(iw-{width})/2', f'(ih-{height})/2')
-                    .output(output_file, vcodec='libx264', acodec='copy')
-                    .overwrite_output()
-                    .run(capture_stdout=True, capture_stderr=True)
-                )
-                
+            # Center the crop box with audio stream-copied
+            argv = (
+                fill_argv(CROP_ARGV, src=input_file, w=int(width), h=int(height))
+                + encode_args() + [output_file]
+            )
+
+            await run_with_progress(argv, info['duration'], "Cropping video...")
+
             console.print("✅ Video cropped successfully!", style="bold green")
-            
-            # Show new file info
-            new_info = get_video_info(output_file)
-            if new_info:
-                new_size = os.path.getsize(output_file) / (1024 * 1024)
-                console.print(f"📊 New file: [green]{output_file}[/green] ([yellow]{new_size:.1f} MB[/yellow], [blue]{new_info['resolution']}[/blue])")
+
+            # Show new file info (we set the crop size ourselves, no need to reprobe)
+            new_size = os.path.getsize(output_file) / (1024 * 1024)
+            console.print(f"📊 New file: [green]{output_file}[/green] ([yellow]{new_size:.1f} MB[/yellow], [blue]{width}x{height}[/blue])")
                 
-        except ffmpeg.Error as e:
-            console.print(f"❌ Error cropping video: {e.stderr.decode() if e.stderr else str(e)}", style="bold red")
+        except RuntimeError as e:
+            console.print(f"❌ Error cropping video: {str(e)}", style="bold red")
         
     except ValueError:
         console.print("❌ Please enter a valid number!", style="bold red")
     except KeyboardInterrupt:
         console.print("\n⚠️  Operation cancelled by user", style="bold yellow")
 
-def main():
+async def resize_crop_video():
+    """Resize and crop in a single ffmpeg pass
+
+    Chaining scale and crop in one filter graph decodes the source once and
+    runs one encode, instead of two full passes with an intermediate file."""
+    # Create header panel
+    header_panel = Panel(
+        "🔗 RESIZE + CROP MODE (One Pass)",
+        style="bold magenta",
+        box=HEAVY,
+        title_align="center"
+    )
+    console.print(header_panel)
+
+    video_files = list_video_files()
+    if not video_files:
+        return
+
+    # Select video file
+    try:
+        choice = select_video_file(video_files)
+
+        input_file = video_files[choice]
+        console.print(f"✅ Selected: [green]{input_file}[/green]")
+
+        # Get current video info
+        info = get_video_info(input_file)
+        if not info:
+            return
+
+        console.print(f"📊 Current Resolution: [blue]{info['resolution']}[/blue]")
+
+        target_resolution = Prompt.ask("[cyan]Scale to resolution (e.g. 1280x720)[/cyan]", default="1280x720")
+        crop_width = int(Prompt.ask("[cyan]Enter crop width[/cyan]"))
+        crop_height = int(Prompt.ask("[cyan]Enter crop height[/cyan]"))
+
+        # Generate output filename
+        name, ext = os.path.splitext(input_file)
+        output_file = f"{name}_resized_cropped_{crop_width}x{crop_height}{ext}"
+
+        console.print(f"\n🔄 Scaling to [yellow]{target_resolution}[/yellow] and cropping to [yellow]{crop_width}x{crop_height}[/yellow] in one pass...")
+        console.print(f"📤 Output: [blue]{output_file}[/blue]")
+
+        try:
+            argv = (
+                fill_argv(SCALE_CROP_ARGV, src=input_file,
+                          res=scale_expr(target_resolution), w=crop_width, h=crop_height)
+                + encode_args() + [output_file]
+            )
+
+            await run_with_progress(argv, info['duration'], "Resizing + cropping...")
+
+            console.print("✅ Video resized and cropped successfully!", style="bold green")
+
+            # Show new file info (we set the crop size ourselves, no need to reprobe)
+            new_size = os.path.getsize(output_file) / (1024 * 1024)
+            console.print(f"📊 New file: [green]{output_file}[/green] ([yellow]{new_size:.1f} MB[/yellow], [blue]{crop_width}x{crop_height}[/blue])")
+
+        except RuntimeError as e:
+            console.print(f"❌ Error processing video: {str(e)}", style="bold red")
+
+    except ValueError:
+        console.print("❌ Please enter a valid number!", style="bold red")
+    except KeyboardInterrupt:
+        console.print("\n⚠️  Operation cancelled by user", style="bold yellow")
+
+async def main():
     """Main program loop"""
     try:
         while True:
@@ -482,21 +836,25 @@ def main():
             print_menu()
             
             try:
-                choice = Prompt.ask("\n[cyan bold]Enter your choice[/cyan bold]", choices=['1', '2', '3', '4', '5'])
-                
+                choice = Prompt.ask("\n[cyan bold]Enter your choice[/cyan bold]", choices=['1', '2', '3', '4', '5', '6', '7'])
+
                 if choice == '1':
-                    resize_video()
+                    await resize_video()
                 elif choice == '2':
-                    split_video()
+                    await split_video()
                 elif choice == '3':
-                    crop_video()
+                    await crop_video()
                 elif choice == '4':
                     list_video_files()
                 elif choice == '5':
+                    batch_resize_video()
+                elif choice == '6':
+                    await resize_crop_video()
+                elif choice == '7':
                     console.print("\n👋 Thanks for using Video Terminal Tool! Goodbye!", style="bold green")
                     break
-                
-                if choice in ['1', '2', '3', '4']:
+
+                if choice in ['1', '2', '3', '4', '5', '6']:
                     Prompt.ask("\n[cyan]Press Enter to continue...[/cyan]", default="")
                     console.clear()  # Clear screen
                     
@@ -510,15 +868,20 @@ def main():
     except Exception as e:
         console.print(f"❌ Unexpected error: {str(e)}", style="bold red")
 
+@functools.cache
+def ffmpeg_available():
+    """Check if FFmpeg is on PATH (pure PATH walk, no subprocess spawn)"""
+    return shutil.which('ffprobe') is not None
+
 if __name__ == "__main__":
     # Check if ffmpeg is available
-    try:
-        ffmpeg.probe("dummy")  # This will fail but test if ffmpeg is available
-    except ffmpeg.Error:
-        pass  # Expected error, ffmpeg is available
-    except FileNotFoundError:
+    if not ffmpeg_available():
         console.print("❌ Error: FFmpeg not found! Please install FFmpeg first.", style="bold red")
         console.print("💡 Install FFmpeg from: https://ffmpeg.org/download.html", style="bold yellow")
         sys.exit(1)
-    
-    main()
\ No newline at end of file
+
+    try:
+        asyncio.run(main())
+    except KeyboardInterrupt:
+        # Ctrl+C mid-encode surfaces here after the loop cancels the main task
+        console.print("\n⚠️  Operation cancelled by user", style="bold yellow")
\ No newline at end of file